@@ -57,17 +57,37 @@ export function deepClone(obj) {
 // 2. Linguistic & Text Processing Utilities (أدوات معالجة اللغة)
 // ============================================================================
 
+// جدول تطبيع يُبنى مرة واحدة عند تحميل الوحدة، ويُطبَّق في مرور واحد على النص.
+// لكل وحدة UTF-16 داخل النطاق العربي: 0 = فاصل (يصبح مسافة)، 1 = يُحذف
+// (التطويل + التشكيل)، غير ذلك = رمز الحرف الناتج بعد توحيد الألف/الياء/التاء.
+const ARABIC_CHAR_MAP = { 'إ': 'ا', 'أ': 'ا', 'آ': 'ا', 'ى': 'ي', 'ة': 'ه' };
+const NORMALIZE_DROP = 1;
+const NORMALIZE_TABLE = (() => {
+  const table = new Uint16Array(0x066A);
+  for (let c = 0x0621; c <= 0x064A; c++) table[c] = c;
+  for (let c = 0x0660; c <= 0x0669; c++) table[c] = c;
+  for (const [from, to] of Object.entries(ARABIC_CHAR_MAP)) table[from.charCodeAt(0)] = to.charCodeAt(0);
+  table[0x0640] = NORMALIZE_DROP;
+  for (let c = 0x064B; c <= 0x0652; c++) table[c] = NORMALIZE_DROP;
+  return table;
+})();
+
 /**
  * يقوم بتطبيع النص العربي (تنظيف شامل).
  */
 export function normalizeArabic(text = "") {
-  let s = safeStr(text);
-  s = s.replace(/[إأآا]/g, 'ا').replace(/ى/g, 'ي').replace(/ة/g, 'ه');
-  s = s.replace(/[\u064B-\u0652]/g, "");
-  s = s.replace(/ـ/g, "");
-  s = s.replace(/[^\u0621-\u064A\u0660-\u0669\s]/g, " ");
-  s = s.replace(/\s+/g, " ").trim();
-  return s;
+  const s = safeStr(text);
+  let out = "";
+  let pendingSpace = false;
+  for (let i = 0; i < s.length; i++) {
+    const c = s.charCodeAt(i);
+    const mapped = c < NORMALIZE_TABLE.length ? NORMALIZE_TABLE[c] : 0;
+    if (mapped === NORMALIZE_DROP) continue;
+    if (mapped === 0) { pendingSpace = out.length > 0; continue; }
+    if (pendingSpace) { out += " "; pendingSpace = false; }
+    out += String.fromCharCode(mapped);
+  }
+  return out;
 }
 
 /**
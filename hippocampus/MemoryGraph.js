@@ -178,6 +178,25 @@ class MemoryGraph {
     return null;
   }
 
+  // One pass over live edges: nodeId -> Map(neighborId -> first edge between them).
+  // Key order matches getNeighbors() and the stored edge matches findEdgeBetween().
+  _buildAdjacency() {
+    const adjacency = new Map();
+    for (const e of this.edges.values()) {
+      if (e.archived) continue;
+      this._linkAdjacency(adjacency, e);
+    }
+    return adjacency;
+  }
+
+  _linkAdjacency(adjacency, e) {
+    if (!adjacency.has(e.source)) adjacency.set(e.source, new Map());
+    if (!adjacency.has(e.target)) adjacency.set(e.target, new Map());
+    const out = adjacency.get(e.source), back = adjacency.get(e.target);
+    if (!out.has(e.target)) out.set(e.target, e);
+    if (!back.has(e.source)) back.set(e.source, e);
+  }
+
   // ----------------- Ingestion & Reinforcement -----------------
   /**
    * Ingest a Knowledge Atom (from KnowledgeAtomizer) into the graph.
@@ -433,24 +452,43 @@ class MemoryGraph {
     }
 
     let newHypotheses = 0;
-    const consideredPairs = new Set();
+
+    // Candidate pairs come from a one-pass adjacency index instead of an
+    // all-pairs scan with an O(E) getNeighbors()/findEdgeBetween() per pair:
+    // only strong nodes two hops from `a` can share a neighbor with it, and they
+    // are visited in the same strength order the full scan used.
+    const adjacency = this._buildAdjacency();
+    const neighborsOf = id => adjacency.get(id) || new Map();
+    const rank = new Map(strongNodes.map((n, idx) => [n.id, idx]));
 
     for (let i = 0; i < strongNodes.length; i++) {
-      for (let j = i + 1; j < strongNodes.length; j++) {
+      const a = strongNodes[i];
+      const candidates = [];
+      const queued = new Set();
+      const enqueueVia = (viaId, afterRank) => {
+        for (const y of neighborsOf(viaId).keys()) {
+          const r = rank.get(y);
+          if (r === undefined || r <= afterRank || queued.has(r)) continue;
+          queued.add(r);
+          // keep candidates sorted by rank (binary insertion)
+          let lo = 0, hi = candidates.length;
+          while (lo < hi) { const mid = (lo + hi) >> 1; if (candidates[mid] < r) lo = mid + 1; else hi = mid; }
+          candidates.splice(lo, 0, r);
+        }
+      };
+      for (const x of neighborsOf(a.id).keys()) enqueueVia(x, i);
+
+      for (let k = 0; k < candidates.length; k++) {
         if (newHypotheses >= MAX_HYPOTHESIS_PER_DREAM) break;
-        const a = strongNodes[i], b = strongNodes[j];
-        const pairKey = `${a.id}::${b.id}`;
-        if (consideredPairs.has(pairKey)) continue;
-        consideredPairs.add(pairKey);
+        const b = strongNodes[candidates[k]];
 
         // existing strong edge? skip
-        const existing = this.findEdgeBetween(a.id, b.id);
+        const existing = neighborsOf(a.id).get(b.id);
         if (existing && existing.strength > 0.6) continue;
 
         // common neighbors heuristic
-        const neighA = this.getNeighbors(a.id);
-        const neighB = this.getNeighbors(b.id);
-        const common = neighA.filter(x => neighB.includes(x));
+        const neighB = neighborsOf(b.id);
+        const common = Array.from(neighborsOf(a.id).keys()).filter(x => neighB.has(x));
         if (common.length >= DREAM_COMMON_NEIGHBORS) {
           // create hypothesized edge
           const eid = this._edgeId("hypothesized_by_dream", a.id, b.id);
@@ -473,6 +511,10 @@ class MemoryGraph {
             createdEdge.lastAccessed = this._nowISO();
             newHypotheses++;
             this._meta("dream_hypothesis", `hyp:${hypId} edge:${eid}`);
+            // keep the index live: b is now a neighbor of a, so b's neighbors
+            // ranked after the current pair become candidates too
+            this._linkAdjacency(adjacency, createdEdge);
+            enqueueVia(b.id, candidates[k]);
           }
         }
       }
@@ -163,9 +163,8 @@ export class InferenceEngine {
   }
 
   _commonNeighbors(aId, bId) {
-    const na = new Set(this.graph.getNeighbors(aId));
     const nb = new Set(this.graph.getNeighbors(bId));
-    return Array.from(na).filter(x => nb.has(x));
+    return this.graph.getNeighbors(aId).filter(x => nb.has(x));
   }
 
   _areConceptuallyDistant(a, b) {
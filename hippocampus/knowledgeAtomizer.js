@@ -80,6 +80,13 @@ function fetchRecentContext(fingerprint) {
 // =================================================================
 
 
+// ---------- Concept vocabulary (normalized once at load) ----------
+// CONCEPTS_MAP is static, so each concept's word list is normalized a single
+// time here instead of on every atomize() call and every token lookup.
+const CONCEPT_WORDS = new Map(
+  Object.entries(CONCEPTS_MAP).map(([concept, data]) => [concept, (data.words || []).map(w => normalizeArabic(w))])
+);
+
 // Merge a list of texts into a short snapshot (most recent first)
 function buildContextSnapshot(recentMessages = []) {
   if (!recentMessages || !recentMessages.length) return null;
@@ -87,13 +94,18 @@ function buildContextSnapshot(recentMessages = []) {
   return slice.map(m => ({ text: String(m.text || m), ts: m.timestamp || null }));
 }
 
+// Normalize + tokenize each recent message once per atomize() call; the
+// relation pass and the pronoun resolver both read from this.
+function prepareRecentContext(recentMessages = []) {
+  return (recentMessages || []).map(rm => ({ text: rm.text, tokens: tokenize(normalizeArabic(rm.text || "")) }));
+}
+
 // ---------- Concept extraction (weighted) ----------
-function extractWeightedConcepts(normalizedMessage) {
-  const tokens = new Set(tokenize(normalizedMessage));
+function extractWeightedConcepts(messageTokens) {
+  const tokens = new Set(messageTokens);
   const conceptScores = new Map();
 
-  for (const [concept, data] of Object.entries(CONCEPTS_MAP)) {
-    const words = (data.words || []).map(w => normalizeArabic(w));
+  for (const [concept, words] of CONCEPT_WORDS) {
     let bestScoreForConcept = 0;
 
     for (const token of tokens) {
@@ -153,7 +165,7 @@ function buildEmotionProfile(conceptScoresMap) {
 function clamp01(x) { return Math.max(0, Math.min(1, x)); }
 
 // ---------- Intensity calculation (upgraded) ----------
-function calculateIntensity(conceptScoresMap, normalizedMessage, emotionProfile) {
+function calculateIntensity(conceptScoresMap, normalizedMessage, tokens, emotionProfile) {
   if (!conceptScoresMap || conceptScoresMap.size === 0) return 0.08;
 
   let numerator = 0, denom = 0;
@@ -164,7 +176,6 @@ function calculateIntensity(conceptScoresMap, normalizedMessage, emotionProfile)
   }
   let intensity = denom > 0 ? numerator / denom : 0.0;
 
-  const tokens = tokenize(normalizedMessage);
   for (const token of tokens) {
     if (INTENSITY_MODIFIERS && INTENSITY_MODIFIERS[token]) {
       intensity *= INTENSITY_MODIFIERS[token];
@@ -183,9 +194,8 @@ function calculateIntensity(conceptScoresMap, normalizedMessage, emotionProfile)
 }
 
 // ---------- Contextual Relation Extraction (improved) ----------
-function extractRelations(normalizedMessage, concepts, recentMessages = []) {
+function extractRelations(tokens, concepts, recentContext = []) {
   const relations = [];
-  const tokens = tokenize(normalizedMessage);
 
   const REL_VERBS = {
     "يسبب": "causes",
@@ -203,7 +213,7 @@ function extractRelations(normalizedMessage, concepts, recentMessages = []) {
 
   function findConceptByToken(tok) {
     for (const c of concepts) {
-      const words = (CONCEPTS_MAP[c] && CONCEPTS_MAP[c].words || []).map(w => normalizeArabic(w));
+      const words = CONCEPT_WORDS.get(c) || [];
       if (words.includes(tok)) return c;
     }
     return null;
@@ -226,7 +236,7 @@ function extractRelations(normalizedMessage, concepts, recentMessages = []) {
       if (subj && obj) {
         relations.push({ subject: subj, verb: REL_VERBS[t], object: obj, evidence: [t] });
       } else if (!subj && obj) {
-        const pronoun = resolvePronounFromContext(tokens, i, recentMessages);
+        const pronoun = resolvePronounFromContext(tokens, i, recentContext);
         if (pronoun && pronoun.subjectConcept) {
           relations.push({ subject: pronoun.subjectConcept, verb: REL_VERBS[t], object: obj, evidence: [t] });
         }
@@ -254,11 +264,9 @@ function extractRelations(normalizedMessage, concepts, recentMessages = []) {
     }
   }
 
-  for (const rm of (recentMessages || [])) {
-    const rnorm = normalizeArabic(rm.text || "");
-    const rtoks = tokenize(rnorm);
+  for (const { tokens: rtoks } of recentContext) {
     for (const c of concepts) {
-      const words = (CONCEPTS_MAP[c] && CONCEPTS_MAP[c].words || []).map(w => normalizeArabic(w));
+      const words = CONCEPT_WORDS.get(c) || [];
       if (rtoks.some(t => words.includes(t))) {
         const emotionTokens = ["خائف", "قلق", "حزين", "حزن", "غضبان", "زعلان", "مسترخي", "سعيد"];
         const foundEmo = tokens.find(t => emotionTokens.includes(t));
@@ -281,16 +289,13 @@ function extractRelations(normalizedMessage, concepts, recentMessages = []) {
 }
 
 // Simple pronoun resolver using recent messages
-function resolvePronounFromContext(tokens, verbIndex, recentMessages = []) {
+function resolvePronounFromContext(tokens, verbIndex, recentContext = []) {
   try {
-    for (let i = (recentMessages || []).length - 1; i >= 0; i--) {
-      const rm = recentMessages[i];
-      const text = normalizeArabic(rm.text || "");
-      const toks = tokenize(text);
-      for (const [concept, data] of Object.entries(CONCEPTS_MAP)) {
-        const words = (data.words || []).map(w => normalizeArabic(w));
+    for (let i = recentContext.length - 1; i >= 0; i--) {
+      const { text, tokens: toks } = recentContext[i];
+      for (const [concept, words] of CONCEPT_WORDS) {
         if (toks.some(t => words.includes(t))) {
-          return { subjectConcept: concept, evidence: [rm.text] };
+          return { subjectConcept: concept, evidence: [text] };
         }
       }
     }
@@ -301,9 +306,8 @@ function resolvePronounFromContext(tokens, verbIndex, recentMessages = []) {
 }
 
 // ---------- Tags & motivational signals ----------
-function extractTags(normalizedMessage, conceptScoresMap, emotionProfile) {
+function extractTags(tokens, conceptScoresMap, emotionProfile) {
   const tags = new Set();
-  const tokens = tokenize(normalizedMessage);
 
   for (const [tag, concepts] of Object.entries(MOTIVATIONAL_MAP || {})) {
     for (const c of concepts) {
@@ -525,6 +529,8 @@ export function atomize(rawMessage = "", options = {}) {
   if (DEBUG) console.log(`\n--- [Atomizer.v3] Atomizing: ${rawMessage} ---`);
 
   const normalizedMessage = normalizeArabic(rawMessage);
+  // tokenized once here and shared by every step below
+  const tokens = tokenize(normalizedMessage);
   const recentFromOptions = Array.isArray(options.recentMessages) ? options.recentMessages : [];
   
   // MODIFICATION: The call to the problematic `fetchRecentContext` is permanently removed.
@@ -533,20 +539,20 @@ export function atomize(rawMessage = "", options = {}) {
   const contextSnapshot = buildContextSnapshot(recentMessages);
 
   // Step 1: concepts
-  const weightedConcepts = extractWeightedConcepts(normalizedMessage);
+  const weightedConcepts = extractWeightedConcepts(tokens);
   const concepts = Array.from(weightedConcepts.keys());
 
   // Step 2: emotion profile (multi-dimensional)
   const emotionProfile = buildEmotionProfile(weightedConcepts);
 
   // Step 3: intensity
-  const intensity = calculateIntensity(weightedConcepts, normalizedMessage, emotionProfile);
+  const intensity = calculateIntensity(weightedConcepts, normalizedMessage, tokens, emotionProfile);
 
   // Step 4: relations (use recentMessages for pronoun resolution)
-  const relations = extractRelations(normalizedMessage, concepts, recentMessages);
+  const relations = extractRelations(tokens, concepts, prepareRecentContext(recentMessages));
 
   // Step 5: tags (motivational + heuristics)
-  const tags = extractTags(normalizedMessage, weightedConcepts, emotionProfile);
+  const tags = extractTags(tokens, weightedConcepts, emotionProfile);
 
   // Step 6: detect subtext intents
   // MODIFICATION: Added protection against infinite recursion.